@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from typing import Literal
@@ -36,7 +37,9 @@ def _qualified(name: str, schema: str | None) -> sql.SQL:
 
 
 def ensure_tables(conn: psycopg.Connection, *, schema: str | None = None) -> None:
-    with conn.cursor() as cur:
+    # Pipeline mode needs libpq >= 14; older clients run the same statements one at a time.
+    pipeline: AbstractContextManager[object] = conn.pipeline() if psycopg.Pipeline.is_supported() else nullcontext()
+    with pipeline, conn.cursor() as cur:
         if schema:
             cur.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema)))
         cur.execute(
@@ -45,7 +45,7 @@ class ZipGap:
     def to_payload(self) -> dict[str, Any]:
         return {
             "listings": sorted(self.listings),
-            "dates": self.dates,
+            "dates": {day: sorted(listings) for day, listings in self.dates.items()},
         }
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import csv
 import os
 from pathlib import Path
 from typing import Iterator
@@ -8,7 +9,10 @@ import psycopg
 import pytest
 from testcontainers.postgres import PostgresContainer
 
+from src.relml.etl.import_csv import REQUIRED_COLUMNS
+
 DDL_PATH = Path(__file__).resolve().parents[1] / "db" / "ddl" / "etl_ledger.sql"
+P1_FIXTURE_ROOT = Path(__file__).resolve().parents[1] / "fixtures" / "p1"
 
 
 @pytest.fixture(scope="module")
@@ -39,3 +43,13 @@ def clean_ledger_table(postgres_url: str) -> Iterator[None]:
         cur.execute("TRUNCATE etl_ledger")
         conn.commit()
     yield
+
+
+@pytest.fixture(scope="session")
+def raw_listings_sample() -> tuple[list[str], tuple[dict[str, str], ...]]:
+    """Parse the P1 raw listings fixture once per session; callers copy rows before mutating them."""
+
+    with (P1_FIXTURE_ROOT / "raw_listings_sample.csv").open(encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        rows = tuple(reader)
+        return list(reader.fieldnames or REQUIRED_COLUMNS), rows
@@ -20,7 +20,7 @@ def temp_conn() -> Iterator[tuple[psycopg.Connection, str]]:
     assert database_url is not None
     conninfo = database_url.replace("+psycopg", "")
     try:
-        conn = psycopg.connect(conninfo)
+        conn = psycopg.connect(conninfo, connect_timeout=2)
     except psycopg.OperationalError:
         pytest.skip("DATABASE_URL host not reachable for acquisition status tests.")
     conn.autocommit = True
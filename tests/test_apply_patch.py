@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tools import apply_patch
+
+
+@pytest.fixture()
+def root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(apply_patch, "ROOT", tmp_path)
+    return tmp_path
+
+
+def test_applies_hunks_across_multiple_files(root: Path) -> None:
+    (root / "a.txt").write_bytes(b"one\ntwo\nthree\n")
+    (root / "b.txt").write_bytes(b"alpha\nbeta\n")
+    diff = """--- a/a.txt
++++ b/a.txt
+@@ -1,3 +1,3 @@
+ one
+-two
++TWO
+ three
+--- a/b.txt
++++ b/b.txt
+@@ -2 +2,2 @@
+ beta
++gamma
+"""
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "a.txt").read_bytes() == b"one\nTWO\nthree\n"
+    assert (root / "b.txt").read_bytes() == b"alpha\nbeta\ngamma\n"
+
+
+def test_zero_length_source_range_inserts_after_line(root: Path) -> None:
+    (root / "a.txt").write_bytes(b"one\ntwo\n")
+    diff = """--- a/a.txt
++++ b/a.txt
+@@ -1,0 +2 @@
++inserted
+@@ -0,0 +1 @@
++first
+"""
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "a.txt").read_bytes() == b"first\none\ninserted\ntwo\n"
+
+
+def test_no_newline_marker_on_new_side_strips_final_newline(root: Path) -> None:
+    (root / "a.txt").write_bytes(b"one\ntwo\n")
+    diff = """--- a/a.txt
++++ b/a.txt
+@@ -1,2 +1,2 @@
+ one
+-two
++TWO
+\\ No newline at end of file
+"""
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "a.txt").read_bytes() == b"one\nTWO"
+
+
+def test_no_newline_marker_on_old_side_keeps_new_newline(root: Path) -> None:
+    (root / "a.txt").write_bytes(b"one\ntwo")
+    diff = """--- a/a.txt
++++ b/a.txt
+@@ -1,2 +1,2 @@
+ one
+-two
+\\ No newline at end of file
++two
+"""
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "a.txt").read_bytes() == b"one\ntwo\n"
+
+
+def test_dev_null_source_creates_file(root: Path) -> None:
+    diff = """--- /dev/null
++++ b/new/dir/c.txt
+@@ -0,0 +1,2 @@
++hello
++world
+"""
+    assert apply_patch.parse_unified_diff(diff)[0][:2] == ("new/dir/c.txt", "new/dir/c.txt")
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "new" / "dir" / "c.txt").read_bytes() == b"hello\nworld\n"
+
+
+def test_dev_null_target_empties_source(root: Path) -> None:
+    (root / "gone.txt").write_bytes(b"bye\n")
+    diff = """--- a/gone.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-bye
+"""
+    assert apply_patch.parse_unified_diff(diff)[0][:2] == ("gone.txt", "gone.txt")
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "gone.txt").read_bytes() == b""
+
+
+def test_content_lines_that_look_like_headers_stay_in_the_hunk(root: Path) -> None:
+    (root / "a.md").write_bytes(b"-- old rule\nkeep\n")
+    diff = """--- a/a.md
++++ b/a.md
+@@ -1,2 +1,4 @@
+--- old rule
++++ new rule
++@@ marker @@
++--- dashes
+ keep
+"""
+    files = apply_patch.parse_unified_diff(diff)
+    assert [(read_path, path) for read_path, path, _ in files] == [("a.md", "a.md")]
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "a.md").read_bytes() == b"++ new rule\n@@ marker @@\n--- dashes\nkeep\n"
+
+
+@pytest.mark.parametrize(
+    "diff",
+    [
+        "--- a/a.txt\n+++ b/a.txt\n@@ -1,3 +1,3 @@\n one\n-two\n",
+        "--- a/a.txt\n+++ b/a.txt\n@@ -1,3 +1,3 @@\n one\n-two\n+TWO\ndiff --git a/b.txt b/b.txt\n",
+    ],
+)
+def test_truncated_hunk_raises(root: Path, diff: str) -> None:
+    with pytest.raises(ValueError):
+        apply_patch.parse_unified_diff(diff)
+
+
+def test_rename_with_hunks_writes_target_and_removes_source(root: Path) -> None:
+    (root / "old.txt").write_bytes(b"one\ntwo\n")
+    diff = """diff --git a/old.txt b/new.txt
+similarity index 50%
+rename from old.txt
+rename to new.txt
+index 1111111..2222222 100644
+--- a/old.txt
++++ b/new.txt
+@@ -1,2 +1,2 @@
+ one
+-two
++TWO
+"""
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "new.txt").read_bytes() == b"one\nTWO\n"
+    assert not (root / "old.txt").exists()
+
+
+def test_rename_without_git_headers_prefers_target() -> None:
+    diff = "--- a/old.txt\n+++ b/new.txt\n@@ -1 +1 @@\n-x\n+y\n"
+    assert [(read_path, path) for read_path, path, _ in apply_patch.parse_unified_diff(diff)] == [
+        ("old.txt", "new.txt")
+    ]
+
+
+def test_pure_rename_moves_file(root: Path) -> None:
+    (root / "old.txt").write_bytes(b"same\n")
+    diff = """diff --git a/old.txt b/sub/new.txt
+similarity index 100%
+rename from old.txt
+rename to sub/new.txt
+diff --git a/other.txt b/other.txt
+--- a/other.txt
++++ b/other.txt
+@@ -0,0 +1 @@
++added
+"""
+    apply_patch.apply_unified_diff(diff)
+    assert (root / "sub" / "new.txt").read_bytes() == b"same\n"
+    assert not (root / "old.txt").exists()
+    assert (root / "other.txt").read_bytes() == b"added\n"
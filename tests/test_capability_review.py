@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tools import capability_review
+
+
+def _write_notices(root: Path, dates: list[Any]) -> None:
+    bus = root / "bus"
+    bus.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps({"capability_notice": {"capability": f"cap{i}", "date": d}}) for i, d in enumerate(dates)]
+    (bus / "capabilities.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _kept_dates(root: Path, monkeypatch: pytest.MonkeyPatch, dates: list[Any], since: str) -> list[Any]:
+    _write_notices(root, dates)
+    monkeypatch.setattr(capability_review, "ROOT", root)
+    return [notice["date"] for notice in capability_review.load_notices(since)]
+
+
+@pytest.mark.parametrize(
+    ("since", "dates", "expected"),
+    [
+        ("2025-09-01", ["2025-08-31T23:59:59Z", "2025-09-01T00:00", "2025-09-02"], ["2025-09-01T00:00", "2025-09-02"]),
+        ("2025-09-01T10:00:00", ["2025-09-01T09:59:59.9Z", "2025-09-01T10:00:00.5"], ["2025-09-01T10:00:00.5"]),
+        # A fractional cutoff must not keep an earlier whole-second "Z" notice just because "Z" sorts after ".".
+        ("2025-09-01T10:00:00.5", ["2025-09-01T10:00:00Z", "2025-09-01T10:00:01Z"], ["2025-09-01T10:00:01Z"]),
+    ],
+)
+def test_filter_since_matches_parsed_chronology(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, since: str, dates: list[str], expected: list[str]
+) -> None:
+    assert _kept_dates(tmp_path, monkeypatch, dates, since) == expected
+
+
+def test_filter_since_keeps_notices_that_cannot_be_compared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # An aware cutoff cannot be ordered against naive notices, and offsets cannot be ordered against a naive cutoff.
+    aware = _kept_dates(tmp_path, monkeypatch, ["2025-09-01T00:00:00", "2020-01-01T00:00:00"], "2025-09-01T00:00:00Z")
+    assert aware == ["2025-09-01T00:00:00", "2020-01-01T00:00:00"]
+    offset = _kept_dates(tmp_path, monkeypatch, ["2020-01-01T00:00:00+05:00", "not-a-date", 12345], "2025-09-01")
+    assert offset == ["2020-01-01T00:00:00+05:00", "not-a-date", 12345]
+
+
+def test_filter_since_drops_undated_and_ignores_bad_cutoff(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert _kept_dates(tmp_path, monkeypatch, ["", "2030-01-01T00:00:00Z"], "2025-09-01") == ["2030-01-01T00:00:00Z"]
+    assert _kept_dates(tmp_path, monkeypatch, ["", "2020-01-01"], "bogus") == ["", "2020-01-01"]
+
+
+def test_filter_since_keeps_invalid_calendar_timestamps(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dates = ["2025-02-30T00:00:00", "2025-13-45T99:99:99", "2025-12-31T23:59:59", "2026-01-01T00:00:00Z"]
+    kept = _kept_dates(tmp_path, monkeypatch, dates, "2026-01-01")
+    assert kept == ["2025-02-30T00:00:00", "2025-13-45T99:99:99", "2026-01-01T00:00:00Z"]
+
+
+def test_render_report_dedups_rows_with_unhashable_fields(tmp_path: Path) -> None:
+    notices: list[dict[str, Any]] = [
+        {"role": "test", "capability": ["a", "b"], "expires": "2026-01-01"},
+        {"role": "test", "capability": ["a", "b"], "expires": "2026-01-01", "reason": "repeat"},
+        {"role": "test", "capability": {"name": "c"}, "expires": "2026-01-01"},
+    ]
+    out_path = tmp_path / "report.md"
+    capability_review.render_report(notices, out_path)
+    rows = out_path.read_text(encoding="utf-8").splitlines()[4:]
+    assert rows == [
+        "| test | ['a', 'b'] |  | | 2026-01-01 |  |  |",
+        "| test | {'name': 'c'} |  | | 2026-01-01 |  |  |",
+    ]
+
+
+def test_load_notices_parses_like_stdlib_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bus = tmp_path / "bus"
+    bus.mkdir()
+    big = 10**23
+    (bus / "capabilities.jsonl").write_text(
+        f'{{"capability_notice": {{"capability": "nan", "score": NaN}}}}\n'
+        f'{{"capability_notice": {{"capability": "big", "score": {big}}}}}\n',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(capability_review, "ROOT", tmp_path)
+    notices = capability_review.load_notices(None)
+    assert [n["capability"] for n in notices] == ["nan", "big"]
+    assert notices[1]["score"] == big
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tools import conductor
+
+
+class _StubResponse:
+    ok = True
+    status_code = 200
+
+    def __init__(self, chunks: list[bytes], fail_after: int | None = None) -> None:
+        self._chunks = chunks
+        self._fail_after = fail_after
+
+    def __enter__(self) -> _StubResponse:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for i, chunk in enumerate(self._chunks):
+            if self._fail_after is not None and i >= self._fail_after:
+                raise ConnectionError("stream dropped")
+            yield chunk
+
+
+class _StubSession:
+    def __init__(self, response: _StubResponse) -> None:
+        self.response = response
+
+    def post(self, *args: Any, **kwargs: Any) -> _StubResponse:
+        return self.response
+
+
+def _stub_session(monkeypatch: pytest.MonkeyPatch, response: _StubResponse) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(conductor, "_session", lambda: _StubSession(response))
+
+
+def test_post_openai_to_file_writes_complete_body(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _stub_session(monkeypatch, _StubResponse([b'{"a": ', b"1}"]))
+    out_path = tmp_path / "TEST-P01-20250101-000000.json"
+    conductor.post_openai_to_file("m", "prompt", out_path)
+    assert out_path.read_bytes() == b'{"a": 1}'
+    assert not out_path.with_suffix(".part").exists()
+
+
+def test_post_openai_to_file_leaves_nothing_when_stream_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _stub_session(monkeypatch, _StubResponse([b'{"a": ', b"1}"], fail_after=1))
+    out_path = tmp_path / "TEST-P01-20250101-000000.json"
+    with pytest.raises(ConnectionError):
+        conductor.post_openai_to_file("m", "prompt", out_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_pick_ready_stories_puts_must_first() -> None:
+    index = conductor.BacklogIndex.build(
+        {
+            "stories": [
+                {"id": "S1", "status": "ready", "priority": "Should"},
+                {"id": "S2", "status": "done", "priority": "Must"},
+                {"id": "S3", "status": "ready", "priority": "Must"},
+                {"id": "S4", "status": "ready"},
+                {"id": "S5", "status": "ready", "priority": "Must"},
+            ]
+        }
+    )
+    assert [s.id for s in conductor.pick_ready_stories(index, 10)] == ["S3", "S5", "S1", "S4"]
+    assert [s.id for s in conductor.pick_ready_stories(index, 3)] == ["S3", "S5", "S1"]
+    assert conductor.pick_next_story(index) == index.by_id["S3"]
+
+
+def test_backlog_index_keeps_first_story_for_repeated_id() -> None:
+    index = conductor.BacklogIndex.build(
+        {
+            "stories": [
+                {"id": "S1", "status": "ready", "title": "first"},
+                {"id": "S1", "status": "ready", "priority": "Must", "title": "second"},
+                {"id": "S2", "status": "ready"},
+            ]
+        }
+    )
+    assert index.by_id["S1"].title == "first"
+    assert [s.id for s in conductor.pick_ready_stories(index, 10)] == ["S1", "S2"]
+    assert conductor.pick_next_story(index) is index.by_id["S1"]
+
+
+_POLICY = {
+    "lanes": {"build": ["test", "backend", "test"]},
+    "role_to_model": {"test": "m", "backend": "m"},
+    "prompt_files": {"common": []},
+}
+
+
+class _TrackingSession:
+    """Records how many distinct stories have a request in flight at once."""
+
+    def __init__(self, fail_story: str | None = None, fail_prefix: str = "", slow_prefix: str | None = None) -> None:
+        self.lock = threading.Lock()
+        self.in_flight: dict[str, int] = {}
+        self.max_stories = 0
+        self.fail_story = fail_story
+        self.fail_prefix = fail_prefix
+        self.slow_prefix = slow_prefix
+
+    def post(self, *args: Any, json: dict[str, Any], **kwargs: Any) -> _StubResponse:
+        text = json["input"][0]["content"][0]["text"]
+        match = re.search(r"story (\S+?):? ", text)
+        assert match is not None
+        story_id = match[1]
+        with self.lock:
+            self.in_flight[story_id] = self.in_flight.get(story_id, 0) + 1
+            self.max_stories = max(self.max_stories, len(self.in_flight))
+        time.sleep(0.2 if self.slow_prefix is not None and text.startswith(self.slow_prefix) else 0.02)
+        with self.lock:
+            self.in_flight[story_id] -= 1
+            if not self.in_flight[story_id]:
+                del self.in_flight[story_id]
+        if story_id == self.fail_story and text.startswith(self.fail_prefix):
+            return _StubResponse([b"{}"], fail_after=0)
+        return _StubResponse([b"{}"])
+
+
+def _stub_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, session: _TrackingSession) -> list[conductor.Story]:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(conductor, "_session", lambda: session)
+    monkeypatch.setattr(conductor, "run_runner", lambda role, goal=None, files=None: goal or "")
+    monkeypatch.setattr(conductor, "PROPOSALS_DIR", tmp_path / "proposals")
+    monkeypatch.setattr(conductor, "CRITIQUES_DIR", tmp_path / "critiques")
+    conductor.ensure_bus_dirs()
+    return [conductor.Story(id=f"P0{i}") for i in range(1, 6)]
+
+
+def test_orchestrate_batch_bounds_stories_in_flight(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    session = _TrackingSession()
+    stories = _stub_batch(tmp_path, monkeypatch, session)
+    concurrency = 2
+    assert asyncio.run(conductor.orchestrate_batch(stories, _POLICY, concurrency)) == []
+    assert session.max_stories == concurrency
+    assert len(list((tmp_path / "critiques").iterdir())) == len(stories)
+
+
+def test_orchestrate_batch_reports_failed_stories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    stories = _stub_batch(tmp_path, monkeypatch, _TrackingSession(fail_story="P03"))
+    assert asyncio.run(conductor.orchestrate_batch(stories, _POLICY, 2)) == ["P03"]
+    assert "Story P03 failed" in capsys.readouterr().err
+    verified = sorted(p.name.split("-")[2] for p in (tmp_path / "critiques").iterdir())
+    assert verified == ["P01", "P02", "P04", "P05"]
+
+
+def test_orchestrate_batch_waits_for_sibling_stage_of_failed_story(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = _TrackingSession(fail_story="P01", fail_prefix="Write failing tests", slow_prefix="Implement")
+    stories = _stub_batch(tmp_path, monkeypatch, session)[:2]
+    assert asyncio.run(conductor.orchestrate_batch(stories, _POLICY, 1)) == ["P01"]
+    assert session.max_stories == 1
+    assert sorted(p.name.split("-")[1] for p in (tmp_path / "proposals").iterdir()) == ["P01", "P02", "P02"]
+
+
+@pytest.mark.parametrize("n", ["0", "-1"])
+def test_batch_rejects_non_positive_n(monkeypatch: pytest.MonkeyPatch, n: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["conductor.py", "batch", "--n", n])
+    with pytest.raises(SystemExit) as excinfo:
+        conductor.main()
+    assert excinfo.value.code == 2  # noqa: PLR2004
@@ -74,6 +74,8 @@ def test_detect_missing_images_by_zip(listings_sample: Path, images_sample: Path
     end = date(2025, 10, 7)
     missing = detect_missing_images_by_zip(detector, start, end, zip_filters={"77002", "73301"})
 
-    assert missing["77002"]["dates"]["2025-10-05"] == ["HAR101"]
-    assert missing["77002"]["dates"]["2025-10-06"] == ["HAR200"]
-    assert set(missing["73301"]["dates"]["2025-10-07"]) == {"HAR104", "HAR202"}
+    expected = {
+        "77002": {"2025-10-05": ["HAR101"], "2025-10-06": ["HAR200"]},
+        "73301": {"2025-10-07": ["HAR104", "HAR202"]},
+    }
+    assert {zip_code: payload["dates"] for zip_code, payload in missing.items()} == expected
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import shutil
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
 from typing import Any, Iterator, cast
 
@@ -11,11 +14,16 @@ from src.relml.etl.acq_status import ImageStatusRow
 from src.relml.etl.gap_detector import GapDetector
 from src.relml.etl.har_downloader import HarDownloadConfig, HarDownloader, HarDownloadRequest, StatusUpdater
 
+_WINDOWS_2025_10_5_8 = tuple(
+    (date.fromordinal(ordinal), date.fromordinal(ordinal))
+    for ordinal in range(date(2025, 10, 5).toordinal(), date(2025, 10, 8).toordinal() + 1)
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class StubDay:
     status: str
-    last_attempt_ts: datetime
+    last_attempt_ns: int
     files_count: int | None
     notes: str | None
 
@@ -23,28 +31,27 @@ class StubDay:
 @dataclass
 class StubStatusUpdater(StatusUpdater):
     daily: dict[date, StubDay] = field(default_factory=dict)
-    images: dict[tuple[str, str], ImageStatusRow] = field(default_factory=dict)
+    images: dict[str, dict[str, ImageStatusRow]] = field(default_factory=lambda: defaultdict(dict))
 
     def mark_day(self, *, day: date, status: str, files_count: int | None = None, notes: str | None = None) -> None:
         self.daily[day] = StubDay(
             status=status,
-            last_attempt_ts=HarDownloader.now(),
+            last_attempt_ns=time.time_ns(),
             files_count=files_count,
             notes=notes,
         )
 
     def mark_listing_images(self, *, listing_key: str, domain: str, status: str, notes: str | None = None) -> None:
-        key = (listing_key, domain)
-        self.images[key] = ImageStatusRow(listing_key, domain, status, HarDownloader.now(), notes)
+        self.images[domain][listing_key] = ImageStatusRow(listing_key, domain, status, HarDownloader.now(), notes)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_gap_detector(tmp_path_factory: pytest.TempPathFactory) -> Iterator[GapDetector]:
     fixtures_root = Path(__file__).resolve().parents[1] / "samples"
     listings_tmp = tmp_path_factory.mktemp("downloads") / "har_listings_sample.csv"
     images_tmp = tmp_path_factory.mktemp("downloads_images") / "listings_images_sample.csv"
-    listings_tmp.write_text((fixtures_root / "har_listings_sample.csv").read_text(encoding="utf-8"), encoding="utf-8")
-    images_tmp.write_text((fixtures_root / "listings_images_sample.csv").read_text(encoding="utf-8"), encoding="utf-8")
+    shutil.copyfile(fixtures_root / "har_listings_sample.csv", listings_tmp)
+    shutil.copyfile(fixtures_root / "listings_images_sample.csv", images_tmp)
     yield GapDetector(listings_csv=listings_tmp, images_csv=images_tmp)
 
 
@@ -66,12 +73,7 @@ def test_planner_computes_date_windows_under_listing_limit(sample_gap_detector:
     request = HarDownloadRequest(since=date(2025, 10, 5), until=date(2025, 10, 8), images=True)
     plan = downloader.plan(request)
 
-    assert plan.listing_windows == [
-        (date(2025, 10, 5), date(2025, 10, 5)),
-        (date(2025, 10, 6), date(2025, 10, 6)),
-        (date(2025, 10, 7), date(2025, 10, 7)),
-        (date(2025, 10, 8), date(2025, 10, 8)),
-    ]
+    assert tuple(plan.listing_windows) == _WINDOWS_2025_10_5_8
     assert plan.image_batches[date(2025, 10, 5)] == {"77002": [["HAR101"]]}
     assert plan.image_batches[date(2025, 10, 6)] == {"77002": [["HAR200"]], "77479": [["HAR102"]]}
     assert plan.image_batches[date(2025, 10, 7)] == {"73301": [["HAR104", "HAR202"]]}
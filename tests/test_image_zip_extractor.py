@@ -52,7 +52,7 @@ def test_extract_image_archives_writes_per_listing_directories(sample_zip: Path,
     assert manifest_path.exists()
     contents = manifest_path.read_text(encoding="utf-8").splitlines()
     assert len(contents) == 3  # noqa: PLR2004
-    entries = [json.loads(line) for line in contents]
+    entries = list(map(json.loads, contents))
     hashes = {entry["sha1"] for entry in entries}
     assert len(hashes) == 3  # noqa: PLR2004
     listing_dirs = [
@@ -74,10 +74,12 @@ def test_extract_image_archives_skips_duplicates_on_rerun(sample_zip: Path, tmp_
     )
     first = extractor.run()
     assert first.images_written == 3  # noqa: PLR2004
+    manifest_path = data_root / "stage" / "images" / "SALE" / "manifest.jsonl"
+    manifest_before = manifest_path.read_bytes()
+    assert manifest_before.count(b"\n") == 3  # noqa: PLR2004
     second = extractor.run()
     assert second.images_written == 0  # noqa: PLR2004
-    manifest_path = data_root / "stage" / "images" / "SALE" / "manifest.jsonl"
-    assert len(manifest_path.read_text(encoding="utf-8").splitlines()) == 3  # noqa: PLR2004
+    assert manifest_path.read_bytes() == manifest_before
 
 
 def test_extract_image_archives_appends_new_images(sample_zip: Path, tmp_path: Path) -> None:
@@ -104,7 +106,7 @@ def test_extract_image_archives_appends_new_images(sample_zip: Path, tmp_path: P
     result = extractor2.run()
     assert result.images_written == 2  # noqa: PLR2004
     manifest_path = data_root / "stage" / "images" / "SALE" / "manifest.jsonl"
-    entries = [json.loads(line) for line in manifest_path.read_text(encoding="utf-8").splitlines()]
+    entries = list(map(json.loads, manifest_path.read_text(encoding="utf-8").splitlines()))
     by_listing = {(item["listing_key"], item["filename"]) for item in entries}
     assert ("123456", "123456_3.jpg") in by_listing
     assert ("777777", "777777_1.jpg") in by_listing
@@ -9,8 +9,6 @@ import pytest
 
 from src.relml.etl.import_csv import REQUIRED_COLUMNS, import_csv
 
-FIXTURE_ROOT = Path(__file__).resolve().parents[1] / "fixtures" / "p1"
-
 
 def _fetch_ledger_rows(url: str) -> list[tuple[str, str, str, int, int, int]]:
     with psycopg.connect(url) as conn, conn.cursor() as cur:
@@ -18,17 +16,27 @@ def _fetch_ledger_rows(url: str) -> list[tuple[str, str, str, int, int, int]]:
         return list(cur.fetchall())
 
 
+def _count_ledger_rows(url: str) -> int:
+    with psycopg.connect(url) as conn, conn.cursor() as cur:
+        cur.execute("SELECT count(*) FROM etl_ledger")
+        row = cur.fetchone()
+    assert row is not None
+    return int(row[0])
+
+
 def _write_rows(path: Path, rows: list[dict[str, str]], fieldnames: Sequence[str]) -> None:
     with path.open("w", encoding="utf-8", newline="") as handle:
         writer = csv.DictWriter(handle, fieldnames=list(fieldnames))
         writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
 
 
 @pytest.mark.integration
 def test_import_csv_quarantines_invalid_rows(
-    monkeypatch: pytest.MonkeyPatch, postgres_url: str, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch,
+    postgres_url: str,
+    tmp_path: Path,
+    raw_listings_sample: tuple[list[str], tuple[dict[str, str], ...]],
 ) -> None:
     data_root = tmp_path / "data_root"
     monkeypatch.setenv("RELML_DATA_ROOT", str(data_root))
@@ -37,10 +45,8 @@ def test_import_csv_quarantines_invalid_rows(
     import_root.mkdir(parents=True, exist_ok=True)
     csv_path = import_root / "raw_listings_sample.csv"
 
-    with (FIXTURE_ROOT / "raw_listings_sample.csv").open(encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        fieldnames = reader.fieldnames or list(REQUIRED_COLUMNS)
-        rows = list(reader)
+    fieldnames, sample_rows = raw_listings_sample
+    rows = [dict(row) for row in sample_rows]
 
     rows[0]["matrix_modified_dt"] = "invalid"
     rows[1]["domain"] = ""
@@ -93,13 +99,15 @@ def test_import_csv_rejects_bad_header(monkeypatch: pytest.MonkeyPatch, postgres
     assert result.rows_quarantined_total == 0  # noqa: PLR2004
     assert result.ledgers and result.ledgers[0]["status"] == "failed"
 
-    ledger_rows = _fetch_ledger_rows(postgres_url)
-    assert ledger_rows == []
+    assert _count_ledger_rows(postgres_url) == 0
 
 
 @pytest.mark.integration
 def test_import_csv_writes_quarantine_csv_with_expected_columns(
-    monkeypatch: pytest.MonkeyPatch, postgres_url: str, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch,
+    postgres_url: str,
+    tmp_path: Path,
+    raw_listings_sample: tuple[list[str], tuple[dict[str, str], ...]],
 ) -> None:
     data_root = tmp_path / "data_root"
     monkeypatch.setenv("RELML_DATA_ROOT", str(data_root))
@@ -108,10 +116,7 @@ def test_import_csv_writes_quarantine_csv_with_expected_columns(
     import_root.mkdir(parents=True, exist_ok=True)
     csv_path = import_root / "raw_listings_sample.csv"
 
-    with (FIXTURE_ROOT / "raw_listings_sample.csv").open(encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        fieldnames = reader.fieldnames or list(REQUIRED_COLUMNS)
-        rows = list(reader)
+    fieldnames, rows = raw_listings_sample
 
     broken_rows = [
         {**rows[0], "matrix_modified_dt": "invalid"},
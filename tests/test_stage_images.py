@@ -10,9 +10,9 @@ from src.relml.etl.stage_images import StageImagesResult, stage_images
 
 def _write_manifest(path: Path, rows: list[dict[str, str]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    with path.open("wb") as handle:
         for row in rows:
-            handle.write(json.dumps(row) + "\n")
+            handle.write(json.dumps(row, separators=(",", ":")).encode("utf-8") + b"\n")
 
 
 @pytest.mark.integration
@@ -59,7 +59,7 @@ def test_stage_images_summarizes_manifest(monkeypatch: pytest.MonkeyPatch, tmp_p
     stage_path = Path(result.stage_file)
     assert stage_path.exists()
 
-    content = json.loads(stage_path.read_text(encoding="utf-8"))
+    content = json.loads(stage_path.read_bytes())
     assert content["images_total"] == 3  # noqa: PLR2004
     per_listing = {row["listing_key"]: row for row in content["listings"]}
 
@@ -115,7 +115,7 @@ def test_stage_images_ignores_invalid_json(monkeypatch: pytest.MonkeyPatch, tmp_
 
     assert result.staged_rows == 2  # noqa: PLR2004
     stage_path = Path(result.stage_file or "")
-    payload = json.loads(stage_path.read_text(encoding="utf-8"))
+    payload = json.loads(stage_path.read_bytes())
     ids = {entry["listing_key"] for entry in payload["listings"]}
     assert ids == {"HAR700", "HAR701"}
 
@@ -139,6 +139,6 @@ def test_stage_images_skips_rows_missing_identity(monkeypatch: pytest.MonkeyPatc
     result = stage_images(ingest_root, dry_run=False)
 
     assert result.staged_rows == 1  # noqa: PLR2004
-    payload = json.loads(Path(result.stage_file or "").read_text(encoding="utf-8"))
+    payload = json.loads(Path(result.stage_file or "").read_bytes())
     assert len(payload["listings"]) == 1  # noqa: PLR2004
     assert payload["listings"][0]["listing_key"] == "HAR800"
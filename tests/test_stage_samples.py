@@ -14,17 +14,16 @@ from src.relml.etl.stage_samples import StageSamplesResult, build_stage_samples
 def _write_csv(path: Path, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows([row[name] for name in fieldnames] for row in rows)
 
 
 def _write_manifest(path: Path, rows: list[dict[str, str]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    with path.open("wb") as handle:
         for row in rows:
-            handle.write(json.dumps(row) + "\n")
+            handle.write(json.dumps(row, separators=(",", ":")).encode("utf-8") + b"\n")
 
 
 @pytest.mark.integration
@@ -131,13 +130,13 @@ def test_build_stage_samples_creates_sample_artifacts(monkeypatch: pytest.Monkey
     listings_sample = Path(result.listings_sample_file)
     assert listings_sample.exists()
     with listings_sample.open(encoding="utf-8") as handle:
-        data = list(csv.DictReader(handle))
+        header, *data = csv.reader(handle)
     assert len(data) == 2  # noqa: PLR2004
-    assert data[0]["listing_key"] == "HAR123"
-    assert data[0]["_source_file"].endswith("listings.csv")
+    assert data[0][header.index("listing_key")] == "HAR123"
+    assert data[0][header.index("_source_file")].endswith("listings.csv")
 
     images_sample = Path(result.images_sample_file)
-    sample_payload = json.loads(images_sample.read_text(encoding="utf-8"))
+    sample_payload = json.loads(images_sample.read_bytes())
     assert sample_payload["images_total"] == 3  # noqa: PLR2004
     assert len(sample_payload["listings"]) == 2  # noqa: PLR2004
     statuses = {entry["status"] for entry in sample_payload["listings"]}
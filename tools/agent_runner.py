@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import argparse
-import datetime
+import functools
 import pathlib
 import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
+MAX_READ_WORKERS = 8
 
 HEADER = (
     "\n### HOW TO USE\n"
@@ -14,22 +17,35 @@ HEADER = (
 )
 
 
+@functools.lru_cache(maxsize=256)
 def read(p: pathlib.Path) -> str:
     return p.read_text(encoding="utf-8")
 
 
-def load_files(paths: list[str]) -> str:
-    blocks = []
-    for s in paths:
-        p = (ROOT / s).resolve()
-        if p.is_dir():
-            continue
-        if not p.exists():
-            blocks.append(f"\n<!-- MISSING: {s} -->\n")
-            continue
-        content = read(p)
-        blocks.append(f"\n===== FILE: {s} =====\n{content}\n")
-    return "\n".join(blocks)
+def _render(s: str) -> str:
+    try:
+        return f"\n===== FILE: {s} =====\n{read(ROOT / s)}\n"
+    except IsADirectoryError:
+        return ""
+    except PermissionError:
+        # Windows raises PermissionError when opening a directory.
+        if (ROOT / s).is_dir():
+            return ""
+        raise
+    except (FileNotFoundError, NotADirectoryError):
+        return f"\n<!-- MISSING: {s} -->\n"
+
+
+@functools.lru_cache(maxsize=32)
+def load_files(paths: tuple[str, ...]) -> str:
+    if len(paths) > 1:
+        # Reads are independent and IO-bound; map keeps the blocks in input order.
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(paths))) as ex:
+            blocks = list(ex.map(_render, paths))
+    else:
+        blocks = [_render(s) for s in paths]
+    # Directories render empty and are dropped so they don't add a separator.
+    return "\n".join(filter(None, blocks))
 
 
 ROLE_FILES = {
@@ -44,11 +60,14 @@ ROLE_FILES = {
     "sre": ".agents/sre.md",
 }
 
-DEF_CONTEXT = [
+PROPOSAL_ROLES = frozenset({"architect", "backend", "pm", "security", "sre", "data_ml"})
+CRITIQUE_ROLES = frozenset({"test", "security", "sre", "pm", "architect"})
+
+DEF_CONTEXT = (
     ".agents/guardrails.md",
     "context/phase_plan.md",
     "context/file_map.md",
-]
+)
 
 SCHEMA_HINT = "Contracts you must respect live under contracts/*. Do not change them without producing an ADR."
 
@@ -56,8 +75,8 @@ SCHEMA_HINT = "Contracts you must respect live under contracts/*. Do not change
 def prompt_for_role(role: str, goal: str | None, files: list[str]) -> str:
     role_md = read(ROOT / ROLE_FILES[role])
     guard = load_files(DEF_CONTEXT)
-    ctx = load_files(files)
-    now = datetime.datetime.utcnow().isoformat() + "Z"
+    ctx = load_files(tuple(files))
+    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     pre = textwrap.dedent(
         f"""
         ## Context
@@ -80,12 +99,44 @@ def prompt_for_role(role: str, goal: str | None, files: list[str]) -> str:
 
 
 def emit_rfc(goal: str, files: list[str]) -> None:
-    rfc_id = f"RFC-{datetime.datetime.utcnow().strftime('%Y-%m-%d-%H%M%S')}"
+    rfc_id = f"RFC-{time.strftime('%Y-%m-%d-%H%M%S', time.gmtime())}"
     prompt = prompt_for_role("manager", goal, files)
     print(prompt)
     print(f"\n# Save the returned JSON to bus/rfc/{rfc_id}.json\n")
 
 
+def build_prompt(  # noqa: PLR0913
+    role: str,
+    goal: str | None = None,
+    files: list[str] | None = None,
+    for_rfc: str | None = None,
+    for_proposal: str | None = None,
+    decide_rfc: str | None = None,
+) -> str:
+    files = files or []
+
+    if for_rfc and role in PROPOSAL_ROLES:
+        rfc_path = ROOT / f"bus/rfc/{for_rfc}.json"
+        files = files + [str(rfc_path.relative_to(ROOT))] if rfc_path.exists() else files
+        return prompt_for_role(role, f"Propose for {for_rfc}", files)
+
+    if for_proposal and role in CRITIQUE_ROLES:
+        prop_path = ROOT / f"bus/proposals/{for_proposal}.json"
+        files = files + [str(prop_path.relative_to(ROOT))] if prop_path.exists() else files
+        return prompt_for_role(role, f"Critique {for_proposal}", files)
+
+    if decide_rfc and role == "manager":
+        rfc_path = ROOT / f"bus/rfc/{decide_rfc}.json"
+        props = list((ROOT / "bus/proposals").glob(f"*{decide_rfc}*.json"))
+        files2 = files.copy()
+        if rfc_path.exists():
+            files2.append(str(rfc_path.relative_to(ROOT)))
+        files2.extend(str(p.relative_to(ROOT)) for p in props)
+        return prompt_for_role("manager", f"Decide {decide_rfc}", files2)
+
+    return prompt_for_role(role, goal, files)
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--role", choices=list(ROLE_FILES.keys()))
@@ -98,34 +149,19 @@ def main() -> None:
     ap.add_argument("--decide", dest="decide_rfc", help="prepare decision prompt for RFC id")
     args = ap.parse_args()
 
-    files = args.files or []
-
     if args.emit == "rfc" and args.role == "manager":
-        return emit_rfc(args.goal or "", files or ["context/phase_plan.md"])  # prints the prompt
-
-    if args.for_rfc and args.role in {"architect", "backend", "pm", "security", "sre", "data_ml"}:
-        rfc_path = ROOT / f"bus/rfc/{args.for_rfc}.json"
-        files = files + [str(rfc_path.relative_to(ROOT))] if rfc_path.exists() else files
-        print(prompt_for_role(args.role, f"Propose for {args.for_rfc}", files))
-        return
-
-    if args.for_proposal and args.role in {"test", "security", "sre", "pm", "architect"}:
-        prop_path = ROOT / f"bus/proposals/{args.for_proposal}.json"
-        files = files + [str(prop_path.relative_to(ROOT))] if prop_path.exists() else files
-        print(prompt_for_role(args.role, f"Critique {args.for_proposal}", files))
-        return
-
-    if args.decide_rfc and args.role == "manager":
-        rfc_path = ROOT / f"bus/rfc/{args.decide_rfc}.json"
-        props = list((ROOT / "bus/proposals").glob(f"*{args.decide_rfc}*.json"))
-        files2 = files.copy()
-        if rfc_path.exists():
-            files2.append(str(rfc_path.relative_to(ROOT)))
-        files2 += [str(p.relative_to(ROOT)) for p in props]
-        print(prompt_for_role("manager", f"Decide {args.decide_rfc}", files2))
-        return
-
-    print(prompt_for_role(args.role, args.goal, files))
+        return emit_rfc(args.goal or "", args.files or ["context/phase_plan.md"])  # prints the prompt
+
+    print(
+        build_prompt(
+            args.role,
+            goal=args.goal,
+            files=args.files,
+            for_rfc=args.for_rfc,
+            for_proposal=args.for_proposal,
+            decide_rfc=args.decide_rfc,
+        )
+    )
 
 
 if __name__ == "__main__":
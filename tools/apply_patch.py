@@ -1,33 +1,126 @@
 from __future__ import annotations
 
 import argparse
+import io
 import pathlib
-
-from unidiff import PatchSet
+import re
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
+DEV_NULL = "/dev/null"
+
+_SOURCE_RE = re.compile(r"^--- ([^\t\r\n]+)")
+_TARGET_RE = re.compile(r"^\+\+\+ ([^\t\r\n]+)")
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@.*$")
+_RENAME_RE = re.compile(r"^rename (from|to) ([^\r\n]+)")
+
+# (source_start, source_length, new-side lines encoded as UTF-8)
+Hunk = tuple[int, int, list[bytes]]
+# (path the original content is read from, path the result is written to, hunks)
+FilePatch = tuple[str, str, list[Hunk]]
+
+
+def _strip_prefix(path: str) -> str:
+    return path[2:] if path.startswith(("a/", "b/")) else path
+
+
+def _patch_path(source: str, target: str) -> str:
+    # A rename (neither side /dev/null and the paths differ) is written to the target.
+    if source == DEV_NULL or (target != DEV_NULL and _strip_prefix(source) != _strip_prefix(target)):
+        return _strip_prefix(target)
+    return _strip_prefix(source)
+
+
+def _read_hunk(lines: list[str], i: int, source_length: int, target_length: int) -> tuple[list[bytes], int]:
+    new_side: list[bytes] = []
+    last_tag = ""
+    while source_length > 0 or target_length > 0 or (i < len(lines) and lines[i].startswith("\\")):
+        if i >= len(lines):
+            raise ValueError("Hunk is shorter than expected")
+        line = lines[i]
+        i += 1
+        tag, value = (" ", line) if line in ("\n", "\r\n") else (line[:1], line[1:])
+        if tag == " ":
+            new_side.append(value.encode("utf-8"))
+            source_length -= 1
+            target_length -= 1
+        elif tag == "+":
+            new_side.append(value.encode("utf-8"))
+            target_length -= 1
+        elif tag == "-":
+            source_length -= 1
+        elif tag == "\\":
+            # "\ No newline at end of file" applies to the line just before it.
+            if last_tag in (" ", "+") and new_side:
+                new_side[-1] = new_side[-1].rstrip(b"\r\n")
+            continue
+        else:
+            raise ValueError(f"Unexpected line in hunk: {line!r}")
+        last_tag = tag
+    return new_side, i
+
+
+def parse_unified_diff(diff_text: str) -> list[FilePatch]:
+    # Split on "\n" only; str.splitlines would also break on form feeds and other separators inside content.
+    lines = list(io.StringIO(diff_text))
+    files: list[FilePatch] = []
+    # git's "rename from"/"rename to" headers; a pure rename has no ---/+++ pair to pick them up.
+    renames: dict[str, str] = {}
+
+    def flush_rename() -> None:
+        if "from" in renames and "to" in renames:
+            files.append((renames["from"], renames["to"], []))
+        renames.clear()
+
+    i = 0
+    while i < len(lines):
+        if lines[i].startswith("diff --git "):
+            flush_rename()
+            i += 1
+            continue
+        rename = _RENAME_RE.match(lines[i])
+        if rename:
+            renames[rename[1]] = rename[2]
+            i += 1
+            continue
+        source = _SOURCE_RE.match(lines[i])
+        target = _TARGET_RE.match(lines[i + 1]) if source and i + 1 < len(lines) else None
+        if source and target:
+            path = _patch_path(source[1], target[1])
+            read_path = path if source[1] == DEV_NULL else _strip_prefix(source[1])
+            files.append((renames.get("from", read_path), renames.get("to", path), []))
+            renames.clear()
+            i += 2
+            continue
+        hunk = _HUNK_RE.match(lines[i])
+        i += 1
+        if hunk and files:
+            source_start, source_length = int(hunk[1]), int(hunk[2] or 1)
+            new_side, i = _read_hunk(lines, i, source_length, int(hunk[4] or 1))
+            files[-1][2].append((source_start, source_length, new_side))
+    flush_rename()
+    return files
 
 
 def apply_unified_diff(diff_text: str) -> None:
-    patch = PatchSet(diff_text)
-    for patched_file in patch:
-        target = ROOT / patched_file.path
-        original = target.read_text(encoding="utf-8") if target.exists() else ""
-        lines = original.splitlines(keepends=True)
-        offset = 0
-        for hunk in patched_file:
-            start = hunk.source_start - 1 + offset
-            length = hunk.source_length
-            repl = []
-            for hunk_line in hunk:
-                if hunk_line.is_added or hunk_line.is_context:
-                    repl.append(hunk_line.value)
-            lines[start : start + length] = repl
-            offset += len(repl) - length
-        new_content = "".join(lines)
+    for read_path, path, hunks in parse_unified_diff(diff_text):
+        source = ROOT / read_path
+        target = ROOT / path
+        lines = source.read_bytes().splitlines(keepends=True) if source.exists() else []
+        # Rebuild the file in one pass: copy untouched spans between hunks, then each hunk's new side.
+        parts: list[bytes] = []
+        cursor = 0
+        for source_start, source_length, new_side in sorted(hunks, key=lambda h: h[0]):
+            # A zero-length source range ("-N,0") inserts after line N rather than replacing it.
+            start = source_start if source_length == 0 else source_start - 1
+            parts.extend(lines[cursor:start])
+            parts.extend(new_side)
+            cursor = start + source_length
+        parts.extend(lines[cursor:])
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(new_content, encoding="utf-8")
-        print(f"Applied: {patched_file.path}")
+        target.write_bytes(b"".join(parts))
+        if read_path != path:
+            source.unlink(missing_ok=True)
+        print(f"Applied: {path}")
 
 
 def main() -> None:
@@ -2,62 +2,104 @@ from __future__ import annotations
 
 import argparse
 import datetime
+import functools
 import json
 import pathlib
+import re
 from typing import Any
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
+NAIVE_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?")
+NOTICE_WRAPPERS = ("capability_notice", "capability_sunset")
+REPORT_HEADER = (
+    "# Capability Review\n"
+    "\n"
+    "| Role | Capability | Level | First Seen | Expires | Tests | Notes |\n"
+    "|---|---|---|---|---|---|---|"
+)
+
+
+def _read_notices(p: pathlib.Path) -> list[dict[str, Any]]:
+    notes: list[dict[str, Any]] = []
+    with p.open("r", encoding="utf-8", buffering=1 << 20) as handle:
+        for raw in handle:
+            line = raw.rstrip("\n")
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(obj, dict):
+                continue
+            for key in NOTICE_WRAPPERS:
+                notice = obj.get(key)
+                if notice is not None:
+                    notes.append(notice)
+                    break
+    return notes
 
 
 def load_notices(since: str | None) -> list[dict[str, Any]]:
     p = ROOT / "bus/capabilities.jsonl"
     if not p.exists():
         return []
-    notes: list[dict[str, Any]] = []
-    for line in p.read_text(encoding="utf-8").splitlines():
-        try:
-            obj = json.loads(line)
-            if "capability_notice" in obj:
-                notes.append(obj["capability_notice"])
-            elif "capability_sunset" in obj:
-                notes.append(obj["capability_sunset"])
-        except Exception:
-            continue
+    notes = _read_notices(p)
     if since:
         try:
             cutoff = datetime.datetime.fromisoformat(since)
-        except Exception:
+        except ValueError:
             return notes
-        filtered: list[dict[str, Any]] = []
-        for notice in notes:
-            date_str = notice.get("date") or notice.get("expires")
-            if date_str:
-                try:
-                    parsed = datetime.datetime.fromisoformat(date_str.replace("Z", ""))
-                    if parsed >= cutoff:
-                        filtered.append(notice)
-                except Exception:
-                    filtered.append(notice)
-        return filtered
+        return _filter_since(notes, cutoff)
     return notes
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime.datetime:
+    return datetime.datetime.fromisoformat(value.replace("Z", ""))
+
+
+def _filter_since(notes: list[dict[str, Any]], cutoff: datetime.datetime) -> list[dict[str, Any]]:
+    # String order only matches chronological order against a naive, whole-second cutoff. A notice is only
+    # dropped after parsing, so an invalid calendar date that still looks like a timestamp is kept.
+    cutoff_s = cutoff.isoformat() if cutoff.tzinfo is None and cutoff.microsecond == 0 else None
+    filtered: list[dict[str, Any]] = []
+    for notice in notes:
+        date_str = notice.get("date") or notice.get("expires")
+        if not date_str:
+            continue
+        if (
+            cutoff_s is not None
+            and isinstance(date_str, str)
+            and NAIVE_TIMESTAMP_RE.fullmatch(date_str)
+            and date_str >= cutoff_s
+        ):
+            filtered.append(notice)
+            continue
+        try:
+            if _parse_iso(date_str) >= cutoff:
+                filtered.append(notice)
+        except (AttributeError, ValueError, TypeError):
+            filtered.append(notice)
+    return filtered
+
+
 def render_report(notices: list[dict[str, Any]], out_path: pathlib.Path) -> None:
-    lines = [
-        "# Capability Review",
-        "",
-        "| Role | Capability | Level | First Seen | Expires | Tests | Notes |",
-        "|---|---|---|---|---|---|---|",
-    ]
-    for notice in notices:
-        role = notice.get("from") or notice.get("role", "?")
-        capability = notice.get("capability", "?")
-        level = notice.get("level", notice.get("action", ""))
-        tests = ", ".join(notice.get("tests_added", []))
-        expires = notice.get("expires", notice.get("date", ""))
-        lines.append(f"| {role} | {capability} | {level} | | {expires} | {tests} | {notice.get('reason', '')} |")
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    seen: set[tuple[str, str, str]] = set()
+    with out_path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.write(REPORT_HEADER)
+        for notice in notices:
+            role = notice.get("from") or notice.get("role", "?")
+            capability = notice.get("capability", "?")
+            expires = notice.get("expires", notice.get("date", ""))
+            key = (str(role), str(capability), str(expires))
+            if key in seen:
+                continue
+            seen.add(key)
+            level = notice.get("level", notice.get("action", ""))
+            tests = ", ".join(notice.get("tests_added", []))
+            fh.write(f"\n| {role} | {capability} | {level} | | {expires} | {tests} | {notice.get('reason', '')} |")
     print(f"Wrote {out_path}")
 
 
@@ -1,36 +1,64 @@
 from __future__ import annotations
 
 import argparse
-import datetime
+import asyncio
+import functools
 import importlib
-import json
+import importlib.util
 import os
 import pathlib
-import subprocess
 import sys
+import threading
+import time
+from dataclasses import dataclass
+from types import ModuleType
 from typing import Any, cast
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 BUS = ROOT / "bus"
+PROPOSALS_DIR = BUS / "proposals"
+CRITIQUES_DIR = BUS / "critiques"
+RUNNER_PATH = ROOT / "tools" / "agent_runner.py"
 POLICY = ROOT / "policy" / "orchestrator.yaml"
+BACKLOG = ROOT / "docs" / "backlog.yaml"
 VERIFY_INDEX = 2
+STREAM_CHUNK_BYTES = 1 << 16
+_RUNNER_LOCK = threading.Lock()
+_SESSION_LOCK = threading.Lock()
 
 
 def now_id() -> str:
-    return datetime.datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    return time.strftime("%Y%m%d-%H%M%S", time.gmtime())
 
 
 def load_yaml(p: pathlib.Path) -> dict[str, Any]:
+    return _load_yaml_cached(str(p), p.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    # mtime_ns is only part of the cache key.
     yaml_module = cast(Any, importlib.import_module("yaml"))
-    data = yaml_module.safe_load(p.read_text(encoding="utf-8"))
+    loader = getattr(yaml_module, "CSafeLoader", yaml_module.SafeLoader)
+    data = yaml_module.load(pathlib.Path(path).read_bytes(), Loader=loader)
     if not isinstance(data, dict):
-        raise ValueError(f"Expected mapping in {p} but found {type(data).__name__}")
-    return cast(dict[str, Any], data)
+        raise ValueError(f"Expected mapping in {path} but found {type(data).__name__}")
+    return data
 
 
-def save_text(p: pathlib.Path, text: str) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(text, encoding="utf-8")
+def _agent_runner() -> ModuleType:
+    with _RUNNER_LOCK:
+        return _load_agent_runner()
+
+
+@functools.cache
+def _load_agent_runner() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("agent_runner", RUNNER_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("agent_runner could not be loaded")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
 
 def run_runner(  # noqa: PLR0913
@@ -41,27 +69,31 @@ def run_runner(  # noqa: PLR0913
     for_proposal: str | None = None,
     decide_rfc: str | None = None,
 ) -> str:
-    cmd = [sys.executable, str(ROOT / "tools" / "agent_runner.py"), "--role", role]
-    if goal:
-        cmd += ["--goal", goal]
-    if files:
-        cmd += ["--files", *files]
-    if for_rfc:
-        cmd += ["--for-rfc", for_rfc]
-    if for_proposal:
-        cmd += ["--for-proposal", for_proposal]
-    if decide_rfc:
-        cmd += ["--decide", decide_rfc]
-    env = os.environ.copy()
-    env.setdefault("PYTHONIOENCODING", "utf-8")
-    env.setdefault("PYTHONUTF8", "1")
-    out = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", check=False, env=env)
-    if out.returncode != 0:
-        raise RuntimeError(f"agent_runner failed: {out.stderr}")
-    return out.stdout
-
-
-def post_openai(model: str, prompt_text: str, max_output_tokens: int = 4000) -> dict[str, Any]:
+    prompt: str = _agent_runner().build_prompt(
+        role,
+        goal=goal,
+        files=files,
+        for_rfc=for_rfc,
+        for_proposal=for_proposal,
+        decide_rfc=decide_rfc,
+    )
+    return prompt
+
+
+def _session() -> Any:
+    with _SESSION_LOCK:
+        return _build_session()
+
+
+@functools.cache
+def _build_session() -> Any:
+    requests_module = cast(Any, importlib.import_module("requests"))
+    session = requests_module.Session()
+    session.mount("https://", requests_module.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+
+def _post_responses(model: str, prompt_text: str, max_output_tokens: int, *, stream: bool = False) -> Any:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY not set in environment")
@@ -72,62 +104,185 @@ def post_openai(model: str, prompt_text: str, max_output_tokens: int = 4000) ->
         "max_output_tokens": max_output_tokens,
     }
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-    requests_module = cast(Any, importlib.import_module("requests"))
-    response = requests_module.post(url, headers=headers, json=payload, timeout=300)
+    response = _session().post(url, headers=headers, json=payload, timeout=300, stream=stream)
     if not response.ok:
         raise RuntimeError(f"OpenAI API error {response.status_code}: {response.text}")
-    data = response.json()
-    if not isinstance(data, dict):
-        raise ValueError("Unexpected OpenAI response payload")
-    return data
+    return response
+
+
+def post_openai_to_file(model: str, prompt_text: str, out_path: pathlib.Path, max_output_tokens: int = 4000) -> None:
+    part_path = out_path.with_suffix(".part")
+    try:
+        with (
+            _post_responses(model, prompt_text, max_output_tokens, stream=True) as response,
+            part_path.open("wb") as fh,
+        ):
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                fh.write(chunk)
+        part_path.replace(out_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
+@dataclass(slots=True)
+class Story:
+    id: str
+    title: str | None = None
+    status: str | None = None
+    priority: str | None = None
+    lane: str = "build"
+    acceptance: tuple[Any, ...] = ()
+
+    @classmethod
+    def from_mapping(cls, raw: dict[str, Any]) -> Story:
+        return cls(
+            id=str(raw["id"]),
+            title=raw.get("title"),
+            status=raw.get("status"),
+            priority=raw.get("priority"),
+            lane=raw.get("lane", "build"),
+            acceptance=tuple(raw.get("acceptance") or ()),
+        )
+
+
+@dataclass(slots=True)
+class BacklogIndex:
+    by_id: dict[str, Story]
+    ready_must: list[Story]
+    ready_any: list[Story]
 
+    @classmethod
+    def build(cls, backlog: dict[str, Any]) -> BacklogIndex:
+        index = cls(by_id={}, ready_must=[], ready_any=[])
+        raw = backlog.get("stories", [])
+        if not isinstance(raw, list):
+            return index
+        for entry in raw:
+            if not isinstance(entry, dict) or "id" not in entry:
+                continue
+            s = Story.from_mapping(entry)
+            # The first story wins when ids repeat.
+            if s.id in index.by_id:
+                continue
+            index.by_id[s.id] = s
+            if s.status != "ready":
+                continue
+            index.ready_any.append(s)
+            if s.priority == "Must":
+                index.ready_must.append(s)
+        return index
 
-def pick_next_story(backlog: dict[str, Any]) -> dict[str, Any] | None:
-    stories = backlog.get("stories", [])
-    if not isinstance(stories, list):
-        return None
-    must = [s for s in stories if isinstance(s, dict) and s.get("status") == "ready" and s.get("priority") == "Must"]
-    if must:
-        return must[0]
-    ready = [s for s in stories if isinstance(s, dict) and s.get("status") == "ready"]
-    return ready[0] if ready else None
 
+def load_backlog(p: pathlib.Path = BACKLOG) -> BacklogIndex:
+    return BacklogIndex.build(load_yaml(p))
 
-def orchestrate_slice(story_id: str) -> None:
-    pol = load_yaml(POLICY)
-    backlog = load_yaml(ROOT / "docs" / "backlog.yaml")
-    stories = backlog.get("stories", [])
-    story = next((s for s in stories if isinstance(s, dict) and s.get("id") == story_id), None)
-    if not isinstance(story, dict):
+
+def pick_next_story(index: BacklogIndex) -> Story | None:
+    if index.ready_must:
+        return index.ready_must[0]
+    return index.ready_any[0] if index.ready_any else None
+
+
+def pick_ready_stories(index: BacklogIndex, n: int) -> list[Story]:
+    rest = (s for s in index.ready_any if s.priority != "Must")
+    return [*index.ready_must, *rest][:n]
+
+
+def find_story(index: BacklogIndex, story_id: str) -> Story:
+    story = index.by_id.get(story_id)
+    if story is None:
         raise SystemExit(f"Story {story_id} not found in docs/backlog.yaml")
-    lane = cast(str, story.get("lane", "build"))
-    lane_roles = pol["lanes"].get(lane, ["test", "backend", "test"])
+    return story
+
+
+async def _run_stage(  # noqa: PLR0913
+    role: str,
+    goal: str,
+    files: list[str],
+    model: str,
+    out_stem: pathlib.Path,
+    extra: str = "",
+) -> None:
+    prompt = await asyncio.to_thread(run_runner, role, goal=goal, files=files)
+    out_path = out_stem.with_name(f"{out_stem.name}-{now_id()}.json")
+    await asyncio.to_thread(post_openai_to_file, model, prompt + extra, out_path)
+
+
+def ensure_bus_dirs() -> None:
+    for bus_dir in (PROPOSALS_DIR, CRITIQUES_DIR):
+        bus_dir.mkdir(parents=True, exist_ok=True)
+
 
-    prompt_files = cast(list[str], pol["prompt_files"]["common"])
-    acceptance_items = story.get("acceptance", [])
-    acceptance = "\n".join(f"- {item}" for item in acceptance_items)
+async def orchestrate_slice(story: Story, pol: dict[str, Any]) -> None:
+    story_id = story.id
+    lane_roles = pol["lanes"].get(story.lane, ["test", "backend", "test"])
 
+    role_models = pol["role_to_model"]
+    prompt_files: list[str] = pol["prompt_files"]["common"]
+    title = story.title
+
+    stages = []
     # TEST -> failing tests
     if lane_roles and lane_roles[0] == "test":
-        goal = f"Write failing tests for story {story_id}: {story.get('title')}"
-        prompt = run_runner("test", goal=goal, files=prompt_files)
-        prompt += f"\n\n### ACCEPTANCE TO ENCODE IN TESTS\n{acceptance}\n"
-        res = post_openai(pol["role_to_model"]["test"], prompt)
-        save_text(BUS / "proposals" / f"TEST-{story_id}-{now_id()}.json", json.dumps(res, indent=2))
-
+        acceptance = "\n".join(f"- {item}" for item in story.acceptance) if story.acceptance else ""
+        stages.append(
+            _run_stage(
+                "test",
+                f"Write failing tests for story {story_id}: {title}",
+                prompt_files,
+                role_models["test"],
+                PROPOSALS_DIR / f"TEST-{story_id}",
+                extra=f"\n\n### ACCEPTANCE TO ENCODE IN TESTS\n{acceptance}\n",
+            )
+        )
     # BACKEND -> implement
     if len(lane_roles) > 1 and lane_roles[1] == "backend":
-        goal = f"Implement code to satisfy tests for story {story_id}: {story.get('title')}"
-        prompt = run_runner("backend", goal=goal, files=prompt_files)
-        res = post_openai(pol["role_to_model"]["backend"], prompt)
-        save_text(BUS / "proposals" / f"BACKEND-{story_id}-{now_id()}.json", json.dumps(res, indent=2))
+        stages.append(
+            _run_stage(
+                "backend",
+                f"Implement code to satisfy tests for story {story_id}: {title}",
+                prompt_files,
+                role_models["backend"],
+                PROPOSALS_DIR / f"BACKEND-{story_id}",
+            )
+        )
+    for result in await asyncio.gather(*stages, return_exceptions=True):
+        if isinstance(result, BaseException):
+            raise result
 
     # TEST -> verify
     if len(lane_roles) > VERIFY_INDEX and lane_roles[VERIFY_INDEX] == "test":
-        goal = f"Verify tests pass for story {story_id} and extend negative tests if gaps exist"
-        prompt = run_runner("test", goal=goal, files=prompt_files)
-        res = post_openai(pol["role_to_model"]["test"], prompt)
-        save_text(BUS / "critiques" / f"TEST-VERIFY-{story_id}-{now_id()}.json", json.dumps(res, indent=2))
+        await _run_stage(
+            "test",
+            f"Verify tests pass for story {story_id} and extend negative tests if gaps exist",
+            prompt_files,
+            role_models["test"],
+            CRITIQUES_DIR / f"TEST-VERIFY-{story_id}",
+        )
+
+
+async def orchestrate_batch(stories: list[Story], pol: dict[str, Any], concurrency: int) -> list[str]:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def bounded(story: Story) -> None:
+        async with sem:
+            await orchestrate_slice(story, pol)
+
+    results = await asyncio.gather(*(bounded(story) for story in stories), return_exceptions=True)
+    failed: list[str] = []
+    for story, result in zip(stories, results, strict=True):
+        if isinstance(result, BaseException):
+            print(f"Story {story.id} failed: {result!r}", file=sys.stderr)
+            failed.append(story.id)
+    return failed
+
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
 
 
 def main() -> None:
@@ -137,21 +292,34 @@ def main() -> None:
     sub.add_parser("next", help="Pick the next ready story and orchestrate")
     p3 = sub.add_parser("run", help="Run a specific story id")
     p3.add_argument("--id", required=True)
+    p4 = sub.add_parser("batch", help="Orchestrate the next N ready stories concurrently")
+    p4.add_argument("--n", type=positive_int, default=4, help="number of ready stories to run")
+    p4.add_argument("--concurrency", type=int, default=2, help="stories in flight at once")
     args = ap.parse_args()
 
     if args.cmd == "init-backlog":
         print("Backlog present at docs/backlog.yaml")
         return
+    backlog = load_backlog()
+    ensure_bus_dirs()
     if args.cmd == "next":
-        backlog = load_yaml(ROOT / "docs" / "backlog.yaml")
         story = pick_next_story(backlog)
-        if not story:
+        if story is None:
             print("No ready stories found.")
             return
-        orchestrate_slice(story["id"])
+        asyncio.run(orchestrate_slice(story, load_yaml(POLICY)))
         return
     if args.cmd == "run":
-        orchestrate_slice(args.id)
+        asyncio.run(orchestrate_slice(find_story(backlog, args.id), load_yaml(POLICY)))
+        return
+    if args.cmd == "batch":
+        stories = pick_ready_stories(backlog, args.n)
+        if not stories:
+            print("No ready stories found.")
+            return
+        failed = asyncio.run(orchestrate_batch(stories, load_yaml(POLICY), max(1, args.concurrency)))
+        if failed:
+            raise SystemExit(f"{len(failed)} of {len(stories)} stories failed: {', '.join(failed)}")
         return
 
 